@@ -17,7 +17,7 @@ class ModuleEntry:
     module: ModuleBase
     button: QtWidgets.QPushButton
     widget: QtWidgets.QWidget
-    status_dot: QtWidgets.QLabel
+    status_dot: QtWidgets.QFrame
 
 
 class ZiMOShell(QtWidgets.QMainWindow):
@@ -133,8 +133,9 @@ class ZiMOShell(QtWidgets.QMainWindow):
                 self._stack.setCurrentWidget(entry.widget)
 
     @staticmethod
-    def _build_status_dot(is_online: bool) -> QtWidgets.QLabel:
-        dot = QtWidgets.QLabel("●")
+    def _build_status_dot(is_online: bool) -> QtWidgets.QFrame:
+        dot = QtWidgets.QFrame()
         dot.setObjectName("StatusDot")
+        dot.setFixedSize(10, 10)
         dot.setProperty("severity", "success" if is_online else "danger")
         return dot
@@ -1,13 +1,137 @@
 from __future__ import annotations
 
+import copy
+import functools
 import json
+import os
+from dataclasses import dataclass
 from pathlib import Path
+from typing import Any, Callable, Mapping
 
 from PySide6 import QtCore, QtGui, QtWidgets
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 from zimo.core.api_client import ApiClient
 from zimo.core.module_base import ModuleBase
 
+_PRESETS_DIR = Path(__file__).with_name("presets")
+_PRESET_NAME_TABLE = str.maketrans({char: "-" for char in '\\/:*?"<>|\0'})
+_PRESET_NAME_MAX_BYTES = 255 - len(".json.tmp")
+_CAMERA_CONNECTED = (True, True, False, True, False, True, True, False)
+_CAMERA_KEYS = tuple(f"camera_{index + 1}" for index in range(len(_CAMERA_CONNECTED)))
+_FPS_CHOICES = ("24 FPS", "30 FPS", "60 FPS", "90 FPS", "120 FPS")
+_RESOLUTION_CHOICES = ("1280 × 720", "1920 × 1080", "2560 × 1440", "3840 × 2160 (4K)")
+_ARUCO_DICTS = ("DICT_4X4_50", "DICT_4X4_100", "DICT_5X5_50", "DICT_6X6_100", "DICT_7X7_250")
+_FPS_INDEX = {text: index for index, text in enumerate(_FPS_CHOICES)}
+_RESOLUTION_INDEX = {text: index for index, text in enumerate(_RESOLUTION_CHOICES)}
+_ARUCO_DICT_INDEX = {text: index for index, text in enumerate(_ARUCO_DICTS)}
+
+
+def _combo_index(indices: Mapping[str, int]) -> Callable[[Any], int | None]:
+    return lambda value: indices.get(str(value))
+
+
+_SETTINGS_SPEC: tuple[tuple[str, tuple[str, ...], str, str, Callable[[Any], Any], object], ...] = (
+    ("_enable_toggle", ("enabled",), "isChecked", "setChecked", bool, True),
+    ("_fps_selector", ("fps",), "currentText", "setCurrentIndex", _combo_index(_FPS_INDEX), "30 FPS"),
+    (
+        "_resolution_selector",
+        ("resolution",),
+        "currentText",
+        "setCurrentIndex",
+        _combo_index(_RESOLUTION_INDEX),
+        "1920 × 1080",
+    ),
+    ("_exposure_slider", ("exposure", "value"), "value", "setValue", int, 40),
+    ("_auto_exposure_toggle", ("exposure", "auto"), "isChecked", "setChecked", bool, True),
+    ("_gain_slider", ("gain", "value"), "value", "setValue", int, 40),
+    ("_auto_gain_toggle", ("gain", "auto"), "isChecked", "setChecked", bool, True),
+    ("_wb_slider", ("white_balance", "value"), "value", "setValue", int, 40),
+    ("_auto_wb_toggle", ("white_balance", "auto"), "isChecked", "setChecked", bool, True),
+    ("_aruco_toggle", ("aruco", "enabled"), "isChecked", "setChecked", bool, True),
+    (
+        "_aruco_dict",
+        ("aruco", "dictionary"),
+        "currentText",
+        "setCurrentIndex",
+        _combo_index(_ARUCO_DICT_INDEX),
+        "DICT_4X4_50",
+    ),
+)
+
+_Binding = tuple[Callable[[], Any], Callable[[Any], None], tuple[str, ...], Callable[[Any], Any], object]
+
+
+@dataclass(slots=True)
+class CameraRow:
+    name: str
+    connected: bool
+    button: QtWidgets.QPushButton
+    edit: QtWidgets.QLineEdit
+    pen: QtWidgets.QPushButton
+
+
+@functools.lru_cache(maxsize=1)
+def _hand_cursor() -> QtGui.QCursor:
+    return QtGui.QCursor(QtCore.Qt.PointingHandCursor)
+
+
+def _dumps_json(data: object, indent: bool = False) -> bytes:
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2 if indent else 0)
+    if indent:
+        return json.dumps(data, indent=2, ensure_ascii=False).encode("utf-8")
+    return json.dumps(data, separators=(",", ":"), ensure_ascii=False).encode("utf-8")
+
+
+def _loads_json(raw: bytes) -> Any:
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+
+def _atomic_write_bytes(path: Path, data: bytes) -> None:
+    tmp_path = path.with_suffix(path.suffix + ".tmp")
+    tmp_path.write_bytes(data)
+    os.replace(tmp_path, path)
+
+
+def _read_json_file(path: str, _mtime_ns: int, _size: int) -> Any:
+    return _loads_json(Path(path).read_bytes())
+
+
+_read_settings_cached = functools.lru_cache(maxsize=1)(_read_json_file)
+_read_preset_cached = functools.lru_cache(maxsize=16)(_read_json_file)
+
+
+class ToggleSwitch(QtWidgets.QCheckBox):
+    def __init__(self, label_on: str, label_off: str, parent: QtWidgets.QWidget | None = None) -> None:
+        super().__init__(label_on, parent)
+        self._label_on = label_on
+        self._label_off = label_off
+        self.setObjectName("ToggleSwitch")
+        self.setCursor(_hand_cursor())
+        self.setChecked(True)
+
+    def checkStateSet(self) -> None:
+        super().checkStateSet()
+        self._sync_text()
+
+    def nextCheckState(self) -> None:
+        super().nextCheckState()
+        self._sync_text()
+
+    def setCheckState(self, state: QtCore.Qt.CheckState) -> None:
+        super().setCheckState(state)
+        self._sync_text()
+
+    def _sync_text(self) -> None:
+        self.setText(self._label_on if self.isChecked() else self._label_off)
+
 
 class VpuModule(ModuleBase):
     title = "Vision Processing Unit"
@@ -20,26 +144,34 @@ class VpuPanel(QtWidgets.QWidget):
     def __init__(self, api: ApiClient) -> None:
         super().__init__()
         self._api = api
-        self._camera_names = [f"Camera {index}" for index in range(1, 9)]
-        self._camera_connected = [True, True, False, True, False, True, True, False]
-        self._camera_buttons: list[QtWidgets.QPushButton] = []
-        self._camera_name_edits: list[QtWidgets.QLineEdit] = []
+        self._cameras: list[CameraRow] = []
         self._current_camera_index = 0
         self._current_camera_label: QtWidgets.QLabel | None = None
-        self._camera_pen_buttons: list[QtWidgets.QPushButton] = []
         self._settings_file = Path(__file__).with_name("vpu_settings.json")
         self._camera_settings: dict[str, dict[str, object]] = self._load_settings()
         self._fps_selector: QtWidgets.QComboBox | None = None
         self._resolution_selector: QtWidgets.QComboBox | None = None
         self._exposure_slider: QtWidgets.QSlider | None = None
-        self._auto_exposure_toggle: QtWidgets.QCheckBox | None = None
+        self._auto_exposure_toggle: ToggleSwitch | None = None
         self._gain_slider: QtWidgets.QSlider | None = None
-        self._auto_gain_toggle: QtWidgets.QCheckBox | None = None
+        self._auto_gain_toggle: ToggleSwitch | None = None
         self._wb_slider: QtWidgets.QSlider | None = None
-        self._auto_wb_toggle: QtWidgets.QCheckBox | None = None
-        self._enable_toggle: QtWidgets.QCheckBox | None = None
-        self._aruco_toggle: QtWidgets.QCheckBox | None = None
+        self._auto_wb_toggle: ToggleSwitch | None = None
+        self._enable_toggle: ToggleSwitch | None = None
+        self._aruco_toggle: ToggleSwitch | None = None
         self._aruco_dict: QtWidgets.QComboBox | None = None
+        self._presets_cache: tuple[int, list[str]] | None = None
+        self._last_persisted_blob: bytes | None = None
+        self._bindings: list[_Binding] = []
+        self._bound_widgets: tuple[QtWidgets.QWidget, ...] = ()
+        self._pending_apply = False
+        self._persist_timer = QtCore.QTimer(self)
+        self._persist_timer.setSingleShot(True)
+        self._persist_timer.setInterval(150)
+        self._persist_timer.timeout.connect(self._write_settings_file)
+        app = QtCore.QCoreApplication.instance()
+        if app is not None:
+            app.aboutToQuit.connect(self._flush_persist)
 
         layout = QtWidgets.QVBoxLayout(self)
         layout.setContentsMargins(24, 24, 24, 24)
@@ -92,42 +224,47 @@ class VpuPanel(QtWidgets.QWidget):
 
         button_group = QtWidgets.QButtonGroup(self)
         button_group.setExclusive(True)
+        edit_mapper = QtCore.QSignalMapper(self)
+        pen_mapper = QtCore.QSignalMapper(self)
 
-        for index, name in enumerate(self._camera_names):
-            row = QtWidgets.QWidget()
-            row_layout = QtWidgets.QHBoxLayout(row)
-            row_layout.setContentsMargins(0, 0, 0, 0)
-            row_layout.setSpacing(8)
+        grid = QtWidgets.QGridLayout()
+        grid.setContentsMargins(0, 0, 0, 0)
+        grid.setHorizontalSpacing(8)
+        grid.setVerticalSpacing(12)
+        grid.setColumnStretch(1, 1)
 
-            status_dot = self._build_status_dot(self._camera_connected[index])
-            row_layout.addWidget(status_dot)
+        for index, connected in enumerate(_CAMERA_CONNECTED):
+            name = f"Camera {index + 1}"
+            grid.addWidget(self._build_status_dot(connected), index, 0)
 
             button = QtWidgets.QPushButton(name)
             button.setCheckable(True)
-            button.setCursor(QtCore.Qt.PointingHandCursor)
-            button.clicked.connect(lambda checked, i=index: self._select_camera(i))
+            button.setCursor(_hand_cursor())
             if index == self._current_camera_index:
                 button.setChecked(True)
-            button_group.addButton(button)
-            row_layout.addWidget(button, 1)
+            button_group.addButton(button, index)
+            grid.addWidget(button, index, 1)
 
             edit = QtWidgets.QLineEdit(name)
             edit.setPlaceholderText("Camera name")
             edit.setVisible(False)
-            edit.editingFinished.connect(lambda i=index: self._apply_camera_rename(i))
-            row_layout.addWidget(edit, 1)
+            edit_mapper.setMapping(edit, index)
+            edit.editingFinished.connect(edit_mapper.map)
+            grid.addWidget(edit, index, 1)
 
             pen = QtWidgets.QPushButton("✎")
             pen.setObjectName("SelectionPen")
-            pen.setCursor(QtCore.Qt.PointingHandCursor)
+            pen.setCursor(_hand_cursor())
             pen.setVisible(index == self._current_camera_index)
-            pen.clicked.connect(lambda checked=False, i=index: self._enable_name_edit(i))
-            row_layout.addWidget(pen)
-
-            layout.addWidget(row)
-            self._camera_buttons.append(button)
-            self._camera_name_edits.append(edit)
-            self._camera_pen_buttons.append(pen)
+            pen_mapper.setMapping(pen, index)
+            pen.clicked.connect(pen_mapper.map)
+            grid.addWidget(pen, index, 2)
+
+            self._cameras.append(CameraRow(name=name, connected=connected, button=button, edit=edit, pen=pen))
+        layout.addLayout(grid)
+        button_group.idClicked.connect(self._select_camera)
+        edit_mapper.mappedInt.connect(self._apply_camera_rename)
+        pen_mapper.mappedInt.connect(self._enable_name_edit)
         layout.addStretch()
         return card
 
@@ -142,7 +279,7 @@ class VpuPanel(QtWidgets.QWidget):
         title.setObjectName("CardTitle")
 
         docs_button = QtWidgets.QPushButton("Open VPU documentation")
-        docs_button.setCursor(QtCore.Qt.PointingHandCursor)
+        docs_button.setCursor(_hand_cursor())
         docs_button.clicked.connect(
             lambda: QtGui.QDesktopServices.openUrl(QtCore.QUrl("https://docs.zimo.no/products/vpu/"))
         )
@@ -164,15 +301,13 @@ class VpuPanel(QtWidgets.QWidget):
 
         layout.addWidget(title)
 
-        current_label = QtWidgets.QLabel(self._camera_names[self._current_camera_index])
+        current_label = QtWidgets.QLabel(self._cameras[self._current_camera_index].name)
         current_label.setObjectName("CardValue")
         self._current_camera_label = current_label
         header_row = QtWidgets.QHBoxLayout()
         header_row.addWidget(current_label)
         header_row.addStretch()
-        enable_toggle = self._build_toggle("On", "Off")
-        enable_toggle.toggled.connect(lambda checked: self._update_toggle_label(enable_toggle, "On", "Off"))
-        self._update_toggle_label(enable_toggle, "On", "Off")
+        enable_toggle = ToggleSwitch("On", "Off")
         self._enable_toggle = enable_toggle
         header_row.addWidget(enable_toggle)
         layout.addLayout(header_row)
@@ -185,21 +320,21 @@ class VpuPanel(QtWidgets.QWidget):
         row = 0
 
         fps_selector = QtWidgets.QComboBox()
-        fps_selector.addItems(["24 FPS", "30 FPS", "60 FPS", "90 FPS", "120 FPS"])
+        fps_selector.addItems(_FPS_CHOICES)
         self._fps_selector = fps_selector
         form.addWidget(QtWidgets.QLabel("FPS"), row, 0)
         form.addWidget(fps_selector, row, 1)
         row += 1
 
         resolution_selector = QtWidgets.QComboBox()
-        resolution_selector.addItems(["1280 × 720", "1920 × 1080", "2560 × 1440", "3840 × 2160 (4K)"])
+        resolution_selector.addItems(_RESOLUTION_CHOICES)
         self._resolution_selector = resolution_selector
         form.addWidget(QtWidgets.QLabel("Resolution"), row, 0)
         form.addWidget(resolution_selector, row, 1)
         row += 1
 
         exposure_slider = self._build_slider()
-        auto_exposure_toggle = self._build_toggle("Auto", "Manual")
+        auto_exposure_toggle = ToggleSwitch("Auto", "Manual")
         self._bind_auto_toggle(auto_exposure_toggle, exposure_slider)
         self._exposure_slider = exposure_slider
         self._auto_exposure_toggle = auto_exposure_toggle
@@ -209,7 +344,7 @@ class VpuPanel(QtWidgets.QWidget):
         row += 1
 
         gain_slider = self._build_slider()
-        auto_gain_toggle = self._build_toggle("Auto", "Manual")
+        auto_gain_toggle = ToggleSwitch("Auto", "Manual")
         self._bind_auto_toggle(auto_gain_toggle, gain_slider)
         self._gain_slider = gain_slider
         self._auto_gain_toggle = auto_gain_toggle
@@ -219,7 +354,7 @@ class VpuPanel(QtWidgets.QWidget):
         row += 1
 
         wb_slider = self._build_slider()
-        auto_wb_toggle = self._build_toggle("Auto", "Manual")
+        auto_wb_toggle = ToggleSwitch("Auto", "Manual")
         self._bind_auto_toggle(auto_wb_toggle, wb_slider)
         self._wb_slider = wb_slider
         self._auto_wb_toggle = auto_wb_toggle
@@ -229,7 +364,7 @@ class VpuPanel(QtWidgets.QWidget):
         row += 1
 
         docs_button = QtWidgets.QPushButton("Open camera documentation")
-        docs_button.setCursor(QtCore.Qt.PointingHandCursor)
+        docs_button.setCursor(_hand_cursor())
         docs_button.clicked.connect(
             lambda: QtGui.QDesktopServices.openUrl(QtCore.QUrl("https://docs.zimo.no/products/camera/"))
         )
@@ -237,24 +372,14 @@ class VpuPanel(QtWidgets.QWidget):
         form.addWidget(docs_button, row, 1)
         row += 1
 
-        aruco_toggle = self._build_toggle("On", "Off")
-        aruco_toggle.toggled.connect(lambda checked: self._update_toggle_label(aruco_toggle, "On", "Off"))
-        self._update_toggle_label(aruco_toggle, "On", "Off")
+        aruco_toggle = ToggleSwitch("On", "Off")
         self._aruco_toggle = aruco_toggle
         form.addWidget(QtWidgets.QLabel("Enable ArUco"), row, 0)
         form.addWidget(aruco_toggle, row, 1)
         row += 1
 
         aruco_dict = QtWidgets.QComboBox()
-        aruco_dict.addItems(
-            [
-                "DICT_4X4_50",
-                "DICT_4X4_100",
-                "DICT_5X5_50",
-                "DICT_6X6_100",
-                "DICT_7X7_250",
-            ]
-        )
+        aruco_dict.addItems(_ARUCO_DICTS)
         self._aruco_dict = aruco_dict
         form.addWidget(QtWidgets.QLabel("ArUco dictionary"), row, 0)
         form.addWidget(aruco_dict, row, 1)
@@ -265,7 +390,7 @@ class VpuPanel(QtWidgets.QWidget):
         gear_row = QtWidgets.QHBoxLayout()
         advanced_button = QtWidgets.QPushButton("⚙")
         advanced_button.setObjectName("GearButton")
-        advanced_button.setCursor(QtCore.Qt.PointingHandCursor)
+        advanced_button.setCursor(_hand_cursor())
         advanced_label = QtWidgets.QLabel("Advanced settings")
         advanced_label.setObjectName("CardMeta")
         gear_row.addStretch()
@@ -275,13 +400,13 @@ class VpuPanel(QtWidgets.QWidget):
 
         presets_row = QtWidgets.QHBoxLayout()
         apply_button = QtWidgets.QPushButton("Apply")
-        apply_button.setCursor(QtCore.Qt.PointingHandCursor)
+        apply_button.setCursor(_hand_cursor())
         apply_button.clicked.connect(self._apply_settings)
         save_button = QtWidgets.QPushButton("Save setup")
-        save_button.setCursor(QtCore.Qt.PointingHandCursor)
+        save_button.setCursor(_hand_cursor())
         save_button.clicked.connect(self._save_preset)
         load_button = QtWidgets.QPushButton("Load preset")
-        load_button.setCursor(QtCore.Qt.PointingHandCursor)
+        load_button.setCursor(_hand_cursor())
         load_button.clicked.connect(self._load_preset)
         presets_row.addWidget(apply_button)
         presets_row.addWidget(save_button)
@@ -290,7 +415,8 @@ class VpuPanel(QtWidgets.QWidget):
         layout.addLayout(presets_row)
         layout.addStretch()
 
-        self._apply_loaded_settings()
+        self._bindings, self._bound_widgets = self._bind_settings_spec()
+        QtCore.QTimer.singleShot(0, self._apply_loaded_settings)
 
         return card
 
@@ -301,102 +427,92 @@ class VpuPanel(QtWidgets.QWidget):
         slider.setValue(40)
         return slider
 
-    @staticmethod
-    def _build_toggle(label_on: str, label_off: str) -> QtWidgets.QCheckBox:
-        toggle = QtWidgets.QCheckBox(label_on)
-        toggle.setObjectName("ToggleSwitch")
-        toggle.setCursor(QtCore.Qt.PointingHandCursor)
-        toggle.setChecked(True)
-        toggle.setProperty("label_on", label_on)
-        toggle.setProperty("label_off", label_off)
-        return toggle
+    def _bind_auto_toggle(self, toggle: ToggleSwitch, slider: QtWidgets.QSlider) -> None:
+        self._sync_auto_toggle(toggle, slider)
+        toggle.toggled.connect(slider.setDisabled)
 
     @staticmethod
-    def _update_toggle_label(toggle: QtWidgets.QCheckBox, label_on: str, label_off: str) -> None:
-        toggle.setText(label_on if toggle.isChecked() else label_off)
-
-    def _bind_auto_toggle(self, toggle: QtWidgets.QCheckBox, slider: QtWidgets.QSlider) -> None:
-        def _sync_state(checked: bool) -> None:
-            toggle.setText("Auto" if checked else "Manual")
-            slider.setEnabled(not checked)
-
-        toggle.setChecked(True)
-        _sync_state(toggle.isChecked())
-        toggle.toggled.connect(_sync_state)
+    def _sync_auto_toggle(toggle: ToggleSwitch, slider: QtWidgets.QSlider) -> None:
+        slider.setEnabled(not toggle.isChecked())
+
+    def _bind_settings_spec(self) -> tuple[list[_Binding], tuple[QtWidgets.QWidget, ...]]:
+        bindings: list[_Binding] = []
+        widgets: list[QtWidgets.QWidget] = []
+        for attr, path, getter, setter, convert, default in _SETTINGS_SPEC:
+            widget = getattr(self, attr)
+            if widget is not None:
+                bindings.append((getattr(widget, getter), getattr(widget, setter), path, convert, default))
+                widgets.append(widget)
+        return bindings, tuple(widgets)
 
     @staticmethod
-    def _build_status_dot(is_online: bool) -> QtWidgets.QLabel:
-        dot = QtWidgets.QLabel("●")
+    def _build_status_dot(is_online: bool) -> QtWidgets.QFrame:
+        dot = QtWidgets.QFrame()
         dot.setObjectName("StatusDot")
+        dot.setFixedSize(10, 10)
         dot.setProperty("severity", "success" if is_online else "danger")
         return dot
 
     def _build_status_legend(self) -> QtWidgets.QWidget:
         legend = QtWidgets.QWidget()
-        layout = QtWidgets.QVBoxLayout(legend)
+        layout = QtWidgets.QGridLayout(legend)
         layout.setContentsMargins(0, 0, 0, 0)
-        layout.setSpacing(6)
+        layout.setHorizontalSpacing(8)
+        layout.setVerticalSpacing(6)
+        layout.setColumnStretch(1, 1)
 
         title = QtWidgets.QLabel("Status legend:")
         title.setObjectName("CardMeta")
+        layout.addWidget(title, 0, 0, 1, 2)
 
-        online_row = QtWidgets.QWidget()
-        online_layout = QtWidgets.QHBoxLayout(online_row)
-        online_layout.setContentsMargins(0, 0, 0, 0)
-        online_layout.setSpacing(8)
-        online_dot = self._build_status_dot(True)
-        online_label = QtWidgets.QLabel("Connected")
-        online_label.setObjectName("CardMeta")
-        online_layout.addWidget(online_dot)
-        online_layout.addWidget(online_label)
-
-        offline_row = QtWidgets.QWidget()
-        offline_layout = QtWidgets.QHBoxLayout(offline_row)
-        offline_layout.setContentsMargins(0, 0, 0, 0)
-        offline_layout.setSpacing(8)
-        offline_dot = self._build_status_dot(False)
-        offline_label = QtWidgets.QLabel("Disconnected")
-        offline_label.setObjectName("CardMeta")
-        offline_layout.addWidget(offline_dot)
-        offline_layout.addWidget(offline_label)
-
-        layout.addWidget(title)
-        layout.addWidget(online_row)
-        layout.addWidget(offline_row)
+        for row, (is_online, text) in enumerate(((True, "Connected"), (False, "Disconnected")), start=1):
+            label = QtWidgets.QLabel(text)
+            label.setObjectName("CardMeta")
+            layout.addWidget(self._build_status_dot(is_online), row, 0)
+            layout.addWidget(label, row, 1)
         return legend
 
     def _select_camera(self, index: int) -> None:
+        previous = self._current_camera_index
         self._current_camera_index = index
         if self._current_camera_label is not None:
-            self._current_camera_label.setText(self._camera_names[index])
-        for button_index, button in enumerate(self._camera_buttons):
-            button.setChecked(button_index == index)
-        for pen_index, pen in enumerate(self._camera_pen_buttons):
-            pen.setVisible(pen_index == index)
-        for edit_index, edit in enumerate(self._camera_name_edits):
-            edit.setText(self._camera_names[edit_index])
-            edit.setVisible(False)
-            self._camera_buttons[edit_index].setVisible(True)
+            self._current_camera_label.setText(self._cameras[index].name)
+        for row_index in (index,) if previous == index else (previous, index):
+            camera = self._cameras[row_index]
+            button, pen, edit = camera.button, camera.pen, camera.edit
+            is_current = row_index == index
+            if button.isChecked() != is_current:
+                button.setChecked(is_current)
+            if pen.isHidden() == is_current:
+                pen.setVisible(is_current)
+            if edit.text() != camera.name:
+                edit.setText(camera.name)
+            if not edit.isHidden():
+                edit.setVisible(False)
+            if button.isHidden():
+                button.setVisible(True)
         self._apply_loaded_settings()
 
     def _enable_name_edit(self, index: int) -> None:
-        edit = self._camera_name_edits[index]
+        camera = self._cameras[index]
+        edit = camera.edit
         edit.setVisible(True)
-        self._camera_buttons[index].setVisible(False)
+        camera.button.setVisible(False)
         edit.setFocus()
         edit.selectAll()
 
     def _apply_camera_rename(self, index: int) -> None:
-        edit = self._camera_name_edits[index]
+        camera = self._cameras[index]
+        edit = camera.edit
         new_name = edit.text().strip()
         if not new_name:
-            edit.setText(self._camera_names[index])
-            new_name = self._camera_names[index]
-        self._camera_names[index] = new_name
-        self._camera_buttons[index].setText(new_name)
+            edit.setText(camera.name)
+            new_name = camera.name
+        camera.name = new_name
+        camera.button.setText(new_name)
         edit.setText(new_name)
         edit.setVisible(False)
-        self._camera_buttons[index].setVisible(True)
+        camera.button.setVisible(True)
         if self._current_camera_label is not None and index == self._current_camera_index:
             self._current_camera_label.setText(new_name)
 
@@ -404,162 +520,73 @@ class VpuPanel(QtWidgets.QWidget):
         if not self._settings_file.exists():
             return {}
         try:
-            return json.loads(self._settings_file.read_text(encoding="utf-8"))
+            stat = self._settings_file.stat()
+            settings = _read_settings_cached(str(self._settings_file), stat.st_mtime_ns, stat.st_size)
         except (json.JSONDecodeError, OSError):
             return {}
-
-    @staticmethod
-    def _default_settings() -> dict[str, object]:
-        return {
-            "enabled": True,
-            "fps": "30 FPS",
-            "resolution": "1920 × 1080",
-            "exposure": {"value": 40, "auto": True},
-            "gain": {"value": 40, "auto": True},
-            "white_balance": {"value": 40, "auto": True},
-            "aruco": {"enabled": True, "dictionary": "DICT_4X4_50"},
-        }
+        return copy.deepcopy(settings)
 
     def _camera_key(self, index: int | None = None) -> str:
         if index is None:
             index = self._current_camera_index
-        return f"camera_{index + 1}"
+        return _CAMERA_KEYS[index]
 
     def _apply_settings(self) -> None:
         if self._fps_selector is None or self._resolution_selector is None:
             return
-        settings = {
-            "name": self._camera_names[self._current_camera_index],
-            "enabled": bool(self._enable_toggle and self._enable_toggle.isChecked()),
-            "fps": self._fps_selector.currentText(),
-            "resolution": self._resolution_selector.currentText(),
-            "exposure": {
-                "value": self._exposure_slider.value() if self._exposure_slider else 0,
-                "auto": bool(self._auto_exposure_toggle and self._auto_exposure_toggle.isChecked()),
-            },
-            "gain": {
-                "value": self._gain_slider.value() if self._gain_slider else 0,
-                "auto": bool(self._auto_gain_toggle and self._auto_gain_toggle.isChecked()),
-            },
-            "white_balance": {
-                "value": self._wb_slider.value() if self._wb_slider else 0,
-                "auto": bool(self._auto_wb_toggle and self._auto_wb_toggle.isChecked()),
-            },
-            "aruco": {
-                "enabled": bool(self._aruco_toggle and self._aruco_toggle.isChecked()),
-                "dictionary": self._aruco_dict.currentText() if self._aruco_dict else "",
-            },
-        }
-        self._camera_settings[self._camera_key()] = settings
-        self._settings_file.write_text(
-            json.dumps(self._camera_settings, indent=2, ensure_ascii=False),
-            encoding="utf-8",
-        )
+        self._persist_current_settings()
 
     def _apply_loaded_settings(self) -> None:
-        settings = self._camera_settings.get(self._camera_key(), {})
-        if not settings:
-            settings = self._default_settings()
-        if not settings:
+        if not self.isVisible():
+            self._pending_apply = True
             return
+        self._pending_apply = False
+        settings = self._camera_settings.get(self._camera_key()) or {}
         name = settings.get("name")
         if isinstance(name, str) and name:
-            self._camera_names[self._current_camera_index] = name
+            camera = self._cameras[self._current_camera_index]
+            camera.name = name
             if self._current_camera_label is not None:
                 self._current_camera_label.setText(name)
-            button = self._camera_buttons[self._current_camera_index]
-            button.setText(name)
-            edit = self._camera_name_edits[self._current_camera_index]
-            edit.setText(name)
-        if self._fps_selector is not None:
-            self._fps_selector.setCurrentText(settings.get("fps", self._fps_selector.currentText()))
-        if self._resolution_selector is not None:
-            self._resolution_selector.setCurrentText(
-                settings.get("resolution", self._resolution_selector.currentText())
-            )
-        if self._enable_toggle is not None:
-            self._enable_toggle.setChecked(bool(settings.get("enabled", True)))
-            self._update_toggle_label(self._enable_toggle, "On", "Off")
-        exposure = settings.get("exposure", {})
-        if self._exposure_slider is not None:
-            self._exposure_slider.setValue(int(exposure.get("value", self._exposure_slider.value())))
-        if self._auto_exposure_toggle is not None:
-            self._auto_exposure_toggle.setChecked(bool(exposure.get("auto", True)))
-        gain = settings.get("gain", {})
-        if self._gain_slider is not None:
-            self._gain_slider.setValue(int(gain.get("value", self._gain_slider.value())))
-        if self._auto_gain_toggle is not None:
-            self._auto_gain_toggle.setChecked(bool(gain.get("auto", True)))
-        white_balance = settings.get("white_balance", {})
-        if self._wb_slider is not None:
-            self._wb_slider.setValue(int(white_balance.get("value", self._wb_slider.value())))
-        if self._auto_wb_toggle is not None:
-            self._auto_wb_toggle.setChecked(bool(white_balance.get("auto", True)))
-        aruco = settings.get("aruco", {})
-        if self._aruco_toggle is not None:
-            self._aruco_toggle.setChecked(bool(aruco.get("enabled", True)))
-            self._update_toggle_label(self._aruco_toggle, "On", "Off")
-        if self._aruco_dict is not None:
-            self._aruco_dict.setCurrentText(aruco.get("dictionary", self._aruco_dict.currentText()))
+            camera.button.setText(name)
+            camera.edit.setText(name)
+        self._apply_settings_snapshot(settings)
 
     def _collect_settings(self, include_name: bool = True) -> dict[str, object]:
-        base = {
-            "enabled": bool(self._enable_toggle and self._enable_toggle.isChecked()),
-            "fps": self._fps_selector.currentText() if self._fps_selector else "30 FPS",
-            "resolution": self._resolution_selector.currentText() if self._resolution_selector else "1920 × 1080",
-            "exposure": {
-                "value": self._exposure_slider.value() if self._exposure_slider else 0,
-                "auto": bool(self._auto_exposure_toggle and self._auto_exposure_toggle.isChecked()),
-            },
-            "gain": {
-                "value": self._gain_slider.value() if self._gain_slider else 0,
-                "auto": bool(self._auto_gain_toggle and self._auto_gain_toggle.isChecked()),
-            },
-            "white_balance": {
-                "value": self._wb_slider.value() if self._wb_slider else 0,
-                "auto": bool(self._auto_wb_toggle and self._auto_wb_toggle.isChecked()),
-            },
-            "aruco": {
-                "enabled": bool(self._aruco_toggle and self._aruco_toggle.isChecked()),
-                "dictionary": self._aruco_dict.currentText() if self._aruco_dict else "",
-            },
-        }
+        base: dict[str, object] = {}
+        for read, _write, path, _convert, _default in self._bindings:
+            target = base
+            for key in path[:-1]:
+                target = target.setdefault(key, {})
+            target[path[-1]] = read()
         if include_name:
-            base["name"] = self._camera_names[self._current_camera_index]
+            base["name"] = self._cameras[self._current_camera_index].name
         return base
 
-    def _apply_settings_snapshot(self, settings: dict[str, object]) -> None:
-        if self._enable_toggle is not None:
-            self._enable_toggle.setChecked(bool(settings.get("enabled", True)))
-            self._update_toggle_label(self._enable_toggle, "On", "Off")
-        if self._fps_selector is not None:
-            self._fps_selector.setCurrentText(str(settings.get("fps", "30 FPS")))
-        if self._resolution_selector is not None:
-            self._resolution_selector.setCurrentText(str(settings.get("resolution", "1920 × 1080")))
-        exposure = settings.get("exposure", {})
-        if self._exposure_slider is not None:
-            self._exposure_slider.setValue(int(exposure.get("value", self._exposure_slider.value())))
-        if self._auto_exposure_toggle is not None:
-            self._auto_exposure_toggle.setChecked(bool(exposure.get("auto", True)))
-        gain = settings.get("gain", {})
-        if self._gain_slider is not None:
-            self._gain_slider.setValue(int(gain.get("value", self._gain_slider.value())))
-        if self._auto_gain_toggle is not None:
-            self._auto_gain_toggle.setChecked(bool(gain.get("auto", True)))
-        white_balance = settings.get("white_balance", {})
-        if self._wb_slider is not None:
-            self._wb_slider.setValue(int(white_balance.get("value", self._wb_slider.value())))
-        if self._auto_wb_toggle is not None:
-            self._auto_wb_toggle.setChecked(bool(white_balance.get("auto", True)))
-        aruco = settings.get("aruco", {})
-        if self._aruco_toggle is not None:
-            self._aruco_toggle.setChecked(bool(aruco.get("enabled", True)))
-            self._update_toggle_label(self._aruco_toggle, "On", "Off")
-        if self._aruco_dict is not None:
-            self._aruco_dict.setCurrentText(str(aruco.get("dictionary", "DICT_4X4_50")))
+    def _apply_settings_snapshot(self, settings: Mapping[str, Any]) -> None:
+        self.setUpdatesEnabled(False)
+        blockers = [QtCore.QSignalBlocker(widget) for widget in self._bound_widgets]
+        try:
+            for _read, write, path, convert, default in self._bindings:
+                source = settings
+                for key in path[:-1]:
+                    source = source.get(key, {})
+                value = convert(source.get(path[-1], default))
+                if value is not None:
+                    write(value)
+            for toggle, slider in (
+                (self._auto_exposure_toggle, self._exposure_slider),
+                (self._auto_gain_toggle, self._gain_slider),
+                (self._auto_wb_toggle, self._wb_slider),
+            ):
+                if toggle is not None and slider is not None:
+                    self._sync_auto_toggle(toggle, slider)
+        finally:
+            del blockers
+            self.setUpdatesEnabled(True)
 
     def _presets_dir(self) -> Path:
-        return Path(__file__).with_name("presets")
+        return _PRESETS_DIR
 
     def _save_preset(self) -> None:
         preset_name, ok = QtWidgets.QInputDialog.getText(
@@ -569,25 +596,35 @@ class VpuPanel(QtWidgets.QWidget):
         )
         if not ok or not preset_name.strip():
             return
-        safe_name = preset_name.strip().replace("/", "-")
+        safe_name = preset_name.strip().translate(_PRESET_NAME_TABLE)
+        safe_name = safe_name.encode("utf-8")[:_PRESET_NAME_MAX_BYTES].decode("utf-8", "ignore")
         preset_path = self._presets_dir() / f"{safe_name}.json"
-        preset_path.parent.mkdir(parents=True, exist_ok=True)
         preset_settings = self._collect_settings(include_name=False)
-        preset_path.write_text(
-            json.dumps(preset_settings, indent=2, ensure_ascii=False),
-            encoding="utf-8",
-        )
+        try:
+            preset_path.parent.mkdir(parents=True, exist_ok=True)
+            _atomic_write_bytes(preset_path, _dumps_json(preset_settings, indent=True))
+        except OSError:
+            QtWidgets.QMessageBox.warning(self, "Save preset", "Preset could not be saved.")
+            return
+        self._presets_cache = None
 
     def _load_preset(self) -> None:
         presets_dir = self._presets_dir()
         if not presets_dir.exists():
             QtWidgets.QMessageBox.information(self, "Load preset", "No presets found.")
             return
-        preset_files = sorted(presets_dir.glob("*.json"))
-        if not preset_files:
+        mtime = presets_dir.stat().st_mtime_ns
+        if self._presets_cache is not None and self._presets_cache[0] == mtime:
+            preset_names = self._presets_cache[1]
+        else:
+            with os.scandir(presets_dir) as entries:
+                preset_names = sorted(
+                    entry.name[:-5] for entry in entries if entry.name.endswith(".json") and entry.is_file()
+                )
+            self._presets_cache = (mtime, preset_names)
+        if not preset_names:
             QtWidgets.QMessageBox.information(self, "Load preset", "No presets found.")
             return
-        preset_names = [path.stem for path in preset_files]
         selection, ok = QtWidgets.QInputDialog.getItem(
             self,
             "Load preset",
@@ -600,7 +637,8 @@ class VpuPanel(QtWidgets.QWidget):
             return
         preset_path = presets_dir / f"{selection}.json"
         try:
-            preset_settings = json.loads(preset_path.read_text(encoding="utf-8"))
+            stat = preset_path.stat()
+            preset_settings = _read_preset_cached(str(preset_path), stat.st_mtime_ns, stat.st_size)
         except (json.JSONDecodeError, OSError):
             QtWidgets.QMessageBox.warning(self, "Load preset", "Preset could not be loaded.")
             return
@@ -608,12 +646,33 @@ class VpuPanel(QtWidgets.QWidget):
         self._persist_current_settings()
 
     def _persist_current_settings(self) -> None:
+        key = self._camera_key()
         settings = self._collect_settings(include_name=True)
-        self._camera_settings[self._camera_key()] = settings
-        self._settings_file.write_text(
-            json.dumps(self._camera_settings, indent=2, ensure_ascii=False),
-            encoding="utf-8",
-        )
+        if settings == self._camera_settings.get(key):
+            return
+        self._camera_settings[key] = settings
+        self._persist_timer.start()
+
+    def _flush_persist(self) -> None:
+        if self._persist_timer.isActive():
+            self._write_settings_file()
+
+    def _write_settings_file(self) -> None:
+        self._persist_timer.stop()
+        blob = _dumps_json(self._camera_settings)
+        if blob == self._last_persisted_blob:
+            return
+        _atomic_write_bytes(self._settings_file, blob)
+        self._last_persisted_blob = blob
+
+    def showEvent(self, event: QtGui.QShowEvent) -> None:
+        super().showEvent(event)
+        if self._pending_apply:
+            self._apply_loaded_settings()
+
+    def closeEvent(self, event: QtGui.QCloseEvent) -> None:
+        self._flush_persist()
+        super().closeEvent(event)
 
 
 if __name__ == "__main__":